@@ -1,50 +1,46 @@
-import pandas as pd
 import plotly.graph_objects as go
 import constants
 
 # Specify treatments to be analyzed (Order according to highest degree of tacit collusion)
 treatments = ["SIM-P-3", "SIM-Q-3", "SEQ-P-3", "SEQ-Q-3"]
 
-# Plot with degree of tacit collusion
-fig = go.Figure(layout=go.Layout(
-    xaxis=dict(title="Gewichtungsfaktor γ"), yaxis=dict(title="Kollusion ϕ")))
+# Read every treatment once and reuse the data for all three plots
+# (only the plotted y values are single precision, gamma is kept exact for the x axis)
+y_columns = ["Phi", "Percentage", "Phi_bedingt"]
+dfs = {
+    treatment: constants.read_csv("data/analyze_gamma/" + treatment + ".csv", usecols=["Gamma"] + y_columns,
+                                  dtype={column: "float32" for column in y_columns})
+    for treatment in treatments
+}
+
+# Build the traces of all three plots in a single pass over the treatments
+traces = {column: [] for column in y_columns}
 for treatment in treatments:
-    df = pd.read_csv("data/analyze_gamma/" + treatment + ".csv")
+    df = dfs[treatment]
+    gamma = df["Gamma"].to_numpy()
 
-    fig.add_trace(go.Scatter(
-        x=df.get("Gamma"), y=df.get("Phi"),
-        mode="lines",
-        name=treatment,
-        line=dict(shape="spline")
-    ))
+    for column in traces:
+        traces[column].append(go.Scatter(
+            x=gamma, y=df[column].to_numpy(),
+            mode="lines",
+            name=treatment,
+            line=dict(shape="spline")
+        ))
+
+# Plot with degree of tacit collusion
+fig = go.Figure(data=traces["Phi"], layout=go.Layout(
+    xaxis=dict(title="Gewichtungsfaktor γ"), yaxis=dict(title="Kollusion ϕ")))
 fig.update_layout(constants.layout)
 fig.show(config=constants.config)
 
 # Plot with percentage of coordination
-fig = go.Figure(layout=go.Layout(xaxis=dict(title="Gewichtungsfaktor γ"), yaxis=dict(title="Koordination ψ (in %)")))
-for treatment in treatments:
-    df = pd.read_csv("data/analyze_gamma/" + treatment + ".csv")
-
-    fig.add_trace(go.Scatter(
-        x=df.get("Gamma"), y=df.get("Percentage"),
-        mode="lines",
-        name=treatment,
-        line=dict(shape="spline")
-    ))
+fig = go.Figure(data=traces["Percentage"], layout=go.Layout(
+    xaxis=dict(title="Gewichtungsfaktor γ"), yaxis=dict(title="Koordination ψ (in %)")))
 fig.update_layout(constants.layout)
 fig.show(config=constants.config)
 
 # Plot with degree of tacit collusion conditioned on coordinative runs
-fig = go.Figure(layout=go.Layout(
+fig = go.Figure(data=traces["Phi_bedingt"], layout=go.Layout(
     xaxis=dict(title="Gewichtungsfaktor γ"), yaxis=dict(title="Kollusion ϕ (bedingt)")))
-for treatment in treatments:
-    df = pd.read_csv("data/analyze_gamma/" + treatment + ".csv")
-
-    fig.add_trace(go.Scatter(
-        x=df.get("Gamma"), y=df.get("Phi_bedingt"),
-        mode="lines",
-        name=treatment,
-        line=dict(shape="spline")
-    ))
 fig.update_layout(constants.layout)
 fig.show(config=constants.config)
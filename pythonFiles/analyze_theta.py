@@ -1,78 +1,70 @@
-import time
-
 import numpy as np
 import pandas as pd
 import plotly.colors
 import plotly.graph_objects as go
-import plotly.express as px
 import constants
-import statsmodels.api as sm
+from scipy.stats import linregress
 
 # Specify treatments to be analyzed (Order according to highest degree of tacit collusion)
 treatments = ["SIM-P-2", "SIM-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-P-2", "SEQ-P-3", "SEQ-Q-2", "SEQ-Q-3"]
 
+# Read every treatment once and reuse the data for plots, regressions and means
+columns = ["THETA", "DEGREE OF TACIT COLLUSION", "PERCENTAGE OF COORDINATION"]
+dfs = {treatment: constants.read_csv("data/analyze_theta/" + treatment + ".csv", usecols=columns)
+       for treatment in treatments}
+
 colors = plotly.colors.DEFAULT_PLOTLY_COLORS
-i = 0
 
-# Plot with degree of tacit collusion
-for treatment in treatments:
-    fig = go.Figure(layout=go.Layout(
-        xaxis=dict(title="Grad der Substituierbarkeit θ"), yaxis=dict(title="Kollusion ϕ"), title=treatment))
-    df = pd.read_csv("data/analyze_theta/" + treatment + ".csv")
+# Plot with degree of tacit collusion (one subplot per treatment)
+fig = constants.subplot_grid(treatments)
+for i, treatment in enumerate(treatments):
+    df = dfs[treatment]
+    row, col = constants.position(i)
 
-    # Line with degree of tacit collusion
+    x = df["THETA"].to_numpy()
+    y = df["DEGREE OF TACIT COLLUSION"].to_numpy()
+
+    # Line with degree of tacit collusion (single precision is enough for the plotted values)
     fig.add_trace(go.Scatter(
-        x=df.get("THETA"), y=df.get("DEGREE OF TACIT COLLUSION"),
+        x=x, y=y.astype(np.float32),
         mode="lines",
         line=dict(color=colors[i], shape="spline", width=3)
-    ))
+    ), row=row, col=col)
 
     # OLS trendline
-    trendline = px.scatter(df, x="THETA", y="DEGREE OF TACIT COLLUSION", trendline="ols",
-                           color_discrete_sequence=[colors[i]])
-    trendline_data = trendline.data[1]
-    fig.add_trace(trendline_data)
-
-    # Vertical line at y=0
-    y = np.empty(df.get("THETA").size); y.fill(0)
+    slope, intercept = np.polyfit(x, y, 1)
     fig.add_trace(go.Scatter(
-        x=df.get("THETA"), y=y,
+        x=x, y=(slope * x + intercept).astype(np.float32),
         mode="lines",
-        line=dict(color='black', dash="longdash")
-    ))
+        line=dict(color=colors[i])
+    ), row=row, col=col)
 
-    # Vertical line at y=1
-    y.fill(1)
-    fig.add_trace(go.Scatter(
-        x=df.get("THETA"), y=y,
-        mode="lines",
-        line=dict(color='black', dash="longdash")
-    ))
+# Horizontal lines at y=0 and y=1
+fig.add_hline(y=0, line=dict(color='black', dash="longdash"), row="all", col="all")
+fig.add_hline(y=1, line=dict(color='black', dash="longdash"), row="all", col="all")
 
-    fig.update_layout(constants.layout, showlegend=False)
-    fig.show(config=constants.config)
-    i += 1
-    time.sleep(3)
+fig.update_xaxes(title="Grad der Substituierbarkeit θ", row=constants.position(len(treatments) - 1)[0])
+fig.update_yaxes(title="Kollusion ϕ", col=1)
+fig.update_layout(constants.layout, showlegend=False)
+fig.show(config=constants.config)
 
 # Regression for tests
 for treatment in treatments:
-    df = pd.read_csv("data/analyze_theta/" + treatment + ".csv")
-
-    x = df.get("THETA")
-    y = df.get("DEGREE OF TACIT COLLUSION")
+    df = dfs[treatment]
 
-    x = sm.add_constant(x)
-    result = sm.OLS(y, x).fit()
-    print(treatment)
-    print(result.summary())
+    result = linregress(df["THETA"].to_numpy(), df["DEGREE OF TACIT COLLUSION"].to_numpy())
+    print(treatment + ": slope={:.4g} intercept={:.4g} p={:.3g} r²={:.3g}".format(
+        result.slope, result.intercept, result.pvalue, result.rvalue ** 2))
 
 # Print (conditional) mean degree of tacit collusion and percentage of collusion
-for treatment in treatments:
-    df = pd.read_csv("data/analyze_theta/" + treatment + ".csv")
-
-    print("\n" + treatment)
-    print("MEAN DEGREE OF TACIT COLLUSION: " + str(np.mean(df.get("DEGREE OF TACIT COLLUSION"))))
-    print("MEAN PERCENTAGE OF COORDINATION: " + str(np.mean(df.get("PERCENTAGE OF COORDINATION"))))
+all_treatments = pd.concat(dfs, names=["TREATMENT"])
+means = all_treatments.groupby(level="TREATMENT", sort=False)[
+    ["DEGREE OF TACIT COLLUSION", "PERCENTAGE OF COORDINATION"]].mean()
+print(means)
 
-    coordinative_runs = df[df["PERCENTAGE OF COORDINATION"] > 0]
-    print("CONDTIONIONAL MEAN DEGREE OF TACIT COLLUSION: " + str(np.mean(coordinative_runs.get("DEGREE OF TACIT COLLUSION"))))
+# Mask only the collusion column instead of copying the whole frame of coordinative runs
+coordinative_runs = all_treatments["PERCENTAGE OF COORDINATION"].to_numpy() > 0
+collusion = all_treatments["DEGREE OF TACIT COLLUSION"]
+# Treatments without coordinative runs are kept and printed as NaN
+conditional_means = collusion[coordinative_runs].groupby(level="TREATMENT").mean().reindex(treatments)
+print(conditional_means.rename("CONDITIONAL MEAN DEGREE OF TACIT COLLUSION"))
@@ -1,4 +1,4 @@
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import constants
 
@@ -14,22 +14,23 @@ boxplots = go.Figure(
     ))
 
 for treatment in treatments:
-    treatment_phi = pd.read_csv("data/heatmap_alpha_delta/unsmoothed/" + treatment + "_phi.csv")
-    treatment_phi_melted = pd.melt(treatment_phi, id_vars="alpha", var_name="delta", value_name="phi")
-    treatment_percentage = pd.read_csv("data/heatmap_alpha_delta/unsmoothed/" + treatment + "_percentage.csv")
-    treatment_percentage_melted = pd.melt(treatment_percentage, id_vars="alpha", var_name="delta",
-                                          value_name="percentage")
-    treatment_data = treatment_phi_melted
-    treatment_data["percentage"] = treatment_percentage_melted.percentage
+    treatment_phi = constants.read_csv("data/heatmap_alpha_delta/unsmoothed/" + treatment + "_phi.csv",
+                                       engine="pyarrow")
+    treatment_percentage = constants.read_csv(
+        "data/heatmap_alpha_delta/unsmoothed/" + treatment + "_percentage.csv", engine="pyarrow")
+
+    # Only the phi values are plotted, so the alpha/delta identifiers are not needed
+    phi = treatment_phi.iloc[:, 1:].to_numpy(dtype=np.float32).ravel()
+    percentage = treatment_percentage.iloc[:, 1:].to_numpy().ravel()
 
     if condition_on_coordinative_runs:
-        treatment_data = treatment_data[treatment_data["percentage"] > 0]
+        phi = phi[percentage > 0]
 
     treatment = treatment[0:7]
 
     boxplots.add_trace(
         go.Box(
-            y=treatment_data.phi,
+            y=phi,
             name=treatment,
             showlegend=False,
             boxmean=True))
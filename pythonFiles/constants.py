@@ -1,4 +1,44 @@
-import plotly.graph_objects as go
+import math
+import os
+
+import joblib
+import pandas as pd
+from plotly.subplots import make_subplots
+
+# Cache parsed CSV files on disk next to this file, so repeated runs while tweaking plots skip parsing
+# (the cache only grows; delete pythonFiles/.cache/ or call memory.clear() to empty it)
+memory = joblib.Memory(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "plotcsv"), verbose=0)
+# Keep the cache from growing without bound when the data files are regenerated
+memory.reduce_size(bytes_limit="1G")
+
+
+@memory.cache
+def _read_csv(path, modification_time, **kwargs):
+    return pd.read_csv(path, **kwargs)
+
+
+# Drop-in replacement for pd.read_csv (the modification time is part of the cache key, so changed files are re-read)
+def read_csv(path, **kwargs):
+    return _read_csv(path, os.path.getmtime(path), **kwargs)
+
+
+# Number of columns when all treatments are shown as subplots of one figure
+subplot_cols = 4
+
+
+# Figure with one subplot per treatment, titled with the treatment names
+def subplot_grid(treatments):
+    fig = make_subplots(rows=math.ceil(len(treatments) / subplot_cols), cols=subplot_cols,
+                        subplot_titles=treatments, horizontal_spacing=0.08)
+    # The subplot titles are annotations, which make_subplots sets to 16px instead of the layout font
+    fig.update_annotations(font=layout["font"])
+    return fig
+
+
+# Row and column of the subplot of the i-th treatment
+def position(i):
+    return i // subplot_cols + 1, i % subplot_cols + 1
+
 
 config = dict({
     'scrollZoom': True,
@@ -12,7 +52,7 @@ config = dict({
         'scale': 1
     }
 })
-layout = go.Layout(
+layout = dict(
     font=dict(
         family="Serif",
         size=36
@@ -1,14 +1,15 @@
-import time
-
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 import constants
 
 # Specify treatment to be analyzed
-treatments = ["SIM-P-2", "SIM-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-P-2", "SEQ-P-3", "SEQ-Q-2", "SEQ-Q-3"]
+# (price treatments first and quantity treatments second, so each row of subplots shares one y-axis title)
+treatments = ["SIM-P-2", "SIM-P-3", "SEQ-P-2", "SEQ-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-Q-2", "SEQ-Q-3"]
+
+# One subplot per treatment
+fig = constants.subplot_grid(treatments)
 
-for treatment in treatments:
+for i, treatment in enumerate(treatments):
     if treatment[4] == "P":
         independent_variable_english = "Price"
         independent_variable_german = "Preis"
@@ -18,41 +19,39 @@ for treatment in treatments:
     else:
         raise Exception("Invalid treatment!")
 
-    df = pd.read_csv("data/deviations/" + treatment + ".csv")
-    nash_equilibrium = df.get(independent_variable_english + " of firm 1").get(3)
+    # Only read the period and the columns of the independent variable
+    path = "data/deviations/" + treatment + ".csv"
+    three_firms = len(constants.read_csv(path, nrows=0).columns) > 7
+    firms = range(1, 4) if three_firms else range(1, 3)
+    df = constants.read_csv(path, usecols=["Period"] + [independent_variable_english + " of firm " + str(firm)
+                                                        for firm in firms])
+    nash_equilibrium = df.at[3, independent_variable_english + " of firm 1"]
+    period = df["Period"].to_numpy()
 
-    fig = go.Figure(layout=go.Layout(
-        xaxis=dict(title="Periode"), yaxis=dict(title=independent_variable_german)
-    ))
-    fig.add_trace(go.Scatter(
-        x=df.get("Period"), y=df.get(independent_variable_english + " of firm 1"),
-        mode="lines",
-        name=independent_variable_german + " von Firma 1"
-    ))
-    fig.add_trace(go.Scatter(
-        x=df.get("Period"), y=df.get(independent_variable_english + " of firm 2"),
-        mode="lines",
-        name=independent_variable_german + " von Firma 2"
-    ))
-    fig.add_annotation(
-        x="t", y=nash_equilibrium,
-        showarrow=True, arrowhead=2, arrowsize=3,
-        text="Erzwungene Abweichung",
-        font_size=50
-    )
-    if len(df.columns) > 7:
-        fig.add_trace(go.Scatter(
-            x=df.get("Period"), y=df.get(independent_variable_english + " of firm 3"),
+    row, col = constants.position(i)
+    for firm in firms:
+        fig.add_trace(go.Scattergl(
+            x=period, y=df[independent_variable_english + " of firm " + str(firm)].to_numpy(dtype=np.float32),
             mode="lines",
-            name=independent_variable_german + " von Firma 3"
-        ))
-    y = np.empty(df.get("Period").size); y.fill(nash_equilibrium)
-    fig.add_trace(go.Scatter(
-        x=df.get("Period"), y=y,
-        mode="lines",
+            name=independent_variable_german + " von Firma " + str(firm)
+        ), row=row, col=col)
+    # The deviation is forced in the same period in every treatment, so it is only labeled in the first subplot
+    if i == 0:
+        fig.add_annotation(
+            x="t", y=nash_equilibrium,
+            showarrow=True, arrowhead=2, arrowsize=2,
+            text="Erzwungene Abweichung",
+            font_size=24,
+            row=row, col=col
+        )
+    fig.add_hline(
+        y=nash_equilibrium,
         name="Nash-" + independent_variable_german,
-        line=dict(color='black', dash="longdash")
-    ))
-    fig.update_layout(constants.layout, showlegend=False, title=treatment)
-    fig.show(config=constants.config)
-    time.sleep(3)
+        line=dict(color='black', dash="longdash"),
+        row=row, col=col
+    )
+    if col == 1:
+        fig.update_yaxes(title=independent_variable_german, row=row, col=col)
+fig.update_xaxes(title="Periode", row=constants.position(len(treatments) - 1)[0])
+fig.update_layout(constants.layout, showlegend=False)
+fig.show(config=constants.config)
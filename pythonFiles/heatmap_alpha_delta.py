@@ -1,7 +1,9 @@
-import time
+import os
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+from numba import njit
 import constants
 
 # Specify treatments to be analyzed
@@ -9,47 +11,76 @@ treatments = ["SIM-P-2", "SIM-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-P-2", "SEQ-P-3",
 # Specify type of smoothing: either "plotly" for automated smoothing or "moore" for Moore Neighborhood smoothing
 smooth_type = "moore"
 
+base_path = "data/heatmap_alpha_delta/unsmoothed/"
+smoothed_path = "data/heatmap_alpha_delta/smoothed/"
+smooth_at_runtime = False
 file_ending_phi = "_phi.csv"
 file_ending_percentage = "_percentage.csv"
-base_path, zsmooth, contours_size, heatmap_colorscale, contours_colorscale = None, None, None, None, None
+zsmooth, contours_size, heatmap_colorscale, contours_colorscale = None, None, None, None
 
 if smooth_type == "plotly":
-    base_path = "data/heatmap_alpha_delta/unsmoothed/"
     zsmooth = "best"
     contours_size = 25
     heatmap_colorscale = "hsv"
     contours_colorscale = "greys"
 elif smooth_type == "moore":
-    base_path = "data/heatmap_alpha_delta/smoothed/"
+    # The precomputed grids in smoothed/ stay the reference, the grids are only smoothed at runtime without them
+    if os.path.isdir(smoothed_path):
+        base_path = smoothed_path
+    else:
+        smooth_at_runtime = True
     zsmooth = False
     contours_size = 20
     heatmap_colorscale = constants.colorscale_heatmap_r
     contours_colorscale = constants.colorscale_all_black
 
-for treatment in treatments:
-    treatment_phi = pd.read_csv(base_path + treatment + file_ending_phi)
-    treatment_phi_melted = pd.melt(treatment_phi, id_vars="alpha", var_name="delta", value_name="phi")
-    heatmap = go.Figure(
-        data=go.Heatmap(
-            x=treatment_phi_melted.alpha,
-            y=treatment_phi_melted.delta,
-            z=treatment_phi_melted.phi,
-            zmin=0, zmid=1, zmax=2,
-            colorscale=heatmap_colorscale,
-            colorbar=dict(title="Kollusion ϕ"),
-            zsmooth=zsmooth),
-        layout=go.Layout(
-            xaxis=dict(title="Lernfaktor α"),
-            yaxis=dict(title="Diskontierungsfaktor δ")
-        )
-    )
-    treatment_percentage = pd.read_csv(base_path + treatment + file_ending_percentage)
-    treatment_percentage_melted = pd.melt(treatment_percentage, id_vars="alpha", var_name="delta",
-                                          value_name="percentage")
-    contours = go.Figure(go.Contour(
-        x=treatment_percentage_melted.alpha,
-        y=treatment_percentage_melted.delta,
-        z=treatment_percentage_melted.percentage,
+
+# Replace every inner cell of an alpha x delta grid by the mean of its Moore neighborhood (border cells are copied)
+@njit(cache=True)
+def moore_smooth(z):
+    smoothed = z.copy()
+    for i in range(1, z.shape[0] - 1):
+        for j in range(1, z.shape[1] - 1):
+            smoothed[i, j] = z[i - 1:i + 2, j - 1:j + 2].mean()
+    return smoothed
+
+
+# One subplot per treatment
+heatmap = constants.subplot_grid(treatments)
+
+for i, treatment in enumerate(treatments):
+    treatment_phi = constants.read_csv(base_path + treatment + file_ending_phi, engine="pyarrow")
+    treatment_percentage = constants.read_csv(base_path + treatment + file_ending_percentage, engine="pyarrow")
+
+    phi = treatment_phi.iloc[:, 1:].to_numpy(dtype=np.float32)
+    percentage = treatment_percentage.iloc[:, 1:].to_numpy(dtype=np.float32)
+    if smooth_at_runtime:
+        phi, percentage = moore_smooth(phi), moore_smooth(percentage)
+
+    # Both files share the same alpha x delta grid, so build one long-form frame in the order of pd.melt
+    alphas = treatment_phi.alpha.to_numpy()
+    # The delta values are stored as column headers, so parse them once instead of keeping them as strings
+    deltas = treatment_phi.columns[1:].astype(float).to_numpy()
+    treatment_data = pd.DataFrame({
+        "alpha": np.tile(alphas, deltas.size),
+        "delta": np.repeat(deltas, alphas.size),
+        "phi": phi.ravel(order="F"),
+        "percentage": percentage.ravel(order="F")
+    })
+
+    row, col = constants.position(i)
+    # All heatmaps share one color axis, so only a single colorbar is drawn
+    heatmap.add_trace(go.Heatmap(
+        x=treatment_data.alpha,
+        y=treatment_data.delta,
+        z=treatment_data.phi,
+        coloraxis="coloraxis",
+        zsmooth=zsmooth
+    ), row=row, col=col)
+    heatmap.add_trace(go.Contour(
+        x=treatment_data.alpha,
+        y=treatment_data.delta,
+        z=treatment_data.percentage,
         showscale=False,
         colorscale=contours_colorscale,
         line=dict(width=1.5),
@@ -59,9 +90,12 @@ for treatment in treatments:
             start=0, end=100, size=contours_size,
             labelfont=dict(size=20)
         )
-    ))
-    heatmap.add_trace(contours.data[0])
-    heatmap.update_layout(constants.layout)
-    heatmap.update_layout(yaxis=dict(tickvals=[0.80, 0.85, 0.90, 0.95, 0.99]))
-    heatmap.show(config=constants.config)
-    time.sleep(3)
\ No newline at end of file
+    ), row=row, col=col)
+heatmap.update_xaxes(title="Lernfaktor α", row=constants.position(len(treatments) - 1)[0])
+heatmap.update_yaxes(title="Diskontierungsfaktor δ", col=1)
+heatmap.update_yaxes(tickvals=[0.80, 0.85, 0.90, 0.95, 0.99])
+heatmap.update_layout(constants.layout, coloraxis=dict(
+    cmin=0, cmid=1, cmax=2,
+    colorscale=heatmap_colorscale,
+    colorbar=dict(title="Kollusion ϕ")))
+heatmap.show(config=constants.config)
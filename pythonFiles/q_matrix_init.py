@@ -5,8 +5,9 @@ import constants
 # Specify treatment to be analyzed
 treatment = "SIM-Q-2"
 
-phi_randomized_uniformly = pd.read_csv("data/q_matrix_init/" + treatment + "_randomized_uniformly.csv")
-phi_zeros = pd.read_csv("data/q_matrix_init/" + treatment + "_zeros.csv")
+phi_randomized_uniformly = constants.read_csv("data/q_matrix_init/" + treatment + "_randomized_uniformly.csv",
+                                              engine="pyarrow")
+phi_zeros = constants.read_csv("data/q_matrix_init/" + treatment + "_zeros.csv", engine="pyarrow")
 phi_randomized_uniformly_melted = pd.melt(phi_randomized_uniformly, id_vars="alpha", var_name="delta", value_name="phi")
 phi_zeros_melted = pd.melt(phi_zeros, id_vars="alpha", var_name="delta", value_name="phi")
 
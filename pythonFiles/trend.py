@@ -1,15 +1,17 @@
-import time
-
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import constants
 
 # Specify treatments to be analyzed
-treatments = ["SIM-P-2", "SIM-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-P-2", "SEQ-P-3", "SEQ-Q-2", "SEQ-Q-3"]
+# (price treatments first and quantity treatments second, so each row of subplots shares one y-axis title)
+treatments = ["SIM-P-2", "SIM-P-3", "SEQ-P-2", "SEQ-P-3", "SIM-Q-2", "SIM-Q-3", "SEQ-Q-2", "SEQ-Q-3"]
 periods_start = 9900
 periods_end = 10000
 
-for treatment in treatments:
+# One subplot per treatment
+fig = constants.subplot_grid(treatments)
+
+for i, treatment in enumerate(treatments):
     if treatment[4] == "P":
         independent_variable_english = "Price"
         independent_variable_german = "Preis"
@@ -19,28 +21,24 @@ for treatment in treatments:
     else:
         raise Exception("Invalid treatment!")
 
-    df = pd.read_csv("data/trend/" + treatment + ".csv")
+    # Only read the period and the columns of the independent variable
+    path = "data/trend/" + treatment + ".csv"
+    three_firms = len(constants.read_csv(path, nrows=0).columns) > 7
+    firms = range(1, 4) if three_firms else range(1, 3)
+    df = constants.read_csv(path, usecols=["Period"] + [independent_variable_english + " of firm " + str(firm)
+                                                        for firm in firms]).iloc[periods_start:periods_end]
+    period = df["Period"].to_numpy()
 
-    fig = go.Figure(layout=go.Layout(
-        xaxis=dict(title="Zeit"), yaxis=dict(title=independent_variable_german)
-    ))
-    fig.add_trace(go.Scatter(
-        x=df.get("Period"), y=df.get(independent_variable_english + " of firm 1")[periods_start:periods_end],
-        mode="lines",
-        name=independent_variable_german + " von Firma 1"
-    ))
-    fig.add_trace(go.Scatter(
-        x=df.get("Period"), y=df.get(independent_variable_english + " of firm 2")[periods_start:periods_end],
-        mode="lines",
-        name=independent_variable_german + " von Firma 2"
-    ))
-    if len(df.columns) > 7:
-        fig.add_trace(go.Scatter(
-            x=df.get("Period"), y=df.get(independent_variable_english + " of firm 3")[periods_start:periods_end],
+    row, col = constants.position(i)
+    for firm in firms:
+        fig.add_trace(go.Scattergl(
+            x=period, y=df[independent_variable_english + " of firm " + str(firm)].to_numpy(dtype=np.float32),
             mode="lines",
-            name=independent_variable_german + " von Firma 3"
-        ))
-    fig.update_xaxes(showticklabels=False)
-    fig.update_layout(constants.layout, showlegend=False)
-    fig.show(config=constants.config)
-    time.sleep(3)
\ No newline at end of file
+            name=independent_variable_german + " von Firma " + str(firm)
+        ), row=row, col=col)
+    if col == 1:
+        fig.update_yaxes(title=independent_variable_german, row=row, col=col)
+fig.update_xaxes(title="Zeit", row=constants.position(len(treatments) - 1)[0])
+fig.update_xaxes(showticklabels=False)
+fig.update_layout(constants.layout, showlegend=False)
+fig.show(config=constants.config)